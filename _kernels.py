@@ -0,0 +1,35 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def _nearest_idx_numpy(arr: np.ndarray, target: float) -> int:
+    """Return the index of the value in arr closest to target, skipping NaNs; -1 if there is none."""
+    diffs = np.abs(arr - target)
+    # np.nanargmin treats NaN as +inf and can pick it over an infinite diff, so index the valid rows explicitly
+    valid = np.flatnonzero(~np.isnan(diffs))
+    if valid.shape[0] == 0:
+        return -1
+    return int(valid[np.argmin(diffs[valid])])
+
+if njit is not None:
+    @njit(cache=True)
+    def nearest_idx(arr, target):
+        """Return the index of the value in arr closest to target in a single pass, skipping NaNs; -1 if there is none."""
+        if arr.shape[0] == 0:
+            return -1
+        best = -1
+        best_diff = 0.0
+        for i in range(arr.shape[0]):
+            diff = arr[i] - target
+            diff = -diff if diff < 0 else diff
+            if diff != diff:
+                continue
+            if best < 0 or diff < best_diff:
+                best_diff = diff
+                best = i
+        return best
+else:
+    nearest_idx = _nearest_idx_numpy
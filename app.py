@@ -1,9 +1,13 @@
 import streamlit as st
-import pandas as pd
 from flexo_uv_curing import FlexoUVCuring
 from utils import validate_bcm, load_saved_settings, save_settings, get_help_text
 from styles import apply_custom_styles
 
+@st.cache_resource
+def get_uv_curing() -> FlexoUVCuring:
+    """Return a FlexoUVCuring instance shared across reruns and sessions."""
+    return FlexoUVCuring()
+
 def main():
     # Apply custom styling
     apply_custom_styles()
@@ -12,13 +16,12 @@ def main():
     if 'saved_settings' not in st.session_state:
         st.session_state.saved_settings = load_saved_settings()
 
-    # Initialize FlexoUVCuring instance
-    uv_curing = FlexoUVCuring()
+    # Get the shared FlexoUVCuring instance
+    uv_curing = get_uv_curing()
 
     # Header
-    st.markdown('<div class="industrial-header">', unsafe_allow_html=True)
-    st.title("CleverCuring - UV Calculator")
-    st.markdown('</div>', unsafe_allow_html=True)
+    with st.container(key="industrial-header"):
+        st.title("CleverCuring - UV Calculator")
 
     # Help information
     with st.expander("ℹ️ Help & Informatie"):
@@ -31,25 +34,20 @@ def main():
         with col1:
             substraat = st.selectbox(
                 "Substraat Type",
-                options=['Gecoat papier', 'Ongecoat papier', 'Folie', 'Karton'],
+                options=uv_curing.SUBSTRATES,
                 help=get_help_text('substrate')
             )
 
             inktsoort = st.selectbox(
                 "Inktsoort",
-                options=['UV-inkt', 'Watergedragen inkt', 'LED-UV inkt'],
+                options=uv_curing.INK_TYPES,
                 help=get_help_text('ink_type')
             )
 
         with col2:
             rasterwals_type = st.selectbox(
                 "Rasterwals Type",
-                options=[
-                    'Hexagonal (20-30% transfer)',
-                    'Hachure / Trihelical (35-40% transfer)',
-                    'ART / TIF (40-50% transfer)',
-                    'GTT UniCoat (25-30% transfer)'
-                ],
+                options=uv_curing.RASTERWALS_TYPES,
                 help=get_help_text('rasterwals')
             )
 
@@ -67,7 +65,7 @@ def main():
             bcm = uv_curing.get_bcm_from_volume(rasterwals_type, selected_volume)
 
             # Display additional information
-            spec_info = next((spec for spec in volume_specs if spec['volume'] == selected_volume), None)
+            spec_info = uv_curing.get_spec(rasterwals_type, selected_volume)
             if spec_info:
                 info_text = f"""
                 Specificaties:
@@ -88,24 +86,23 @@ def main():
             result = uv_curing.bereken_uv_vermogen(substraat, inktsoort, bcm, rasterwals_type, selected_volume)
 
             # Display results in an organized way
-            st.markdown('<div class="info-box">', unsafe_allow_html=True)
-            st.subheader("Berekende UV Instellingen")
-
-            col1, col2 = st.columns(2)
-            with col1:
-                st.metric("UV Vermogen", f"{result['final_power']}%")
-            with col2:
-                st.metric("Inktoverdracht", result['transfer_value'])
-
-            # Detailed breakdown
-            st.markdown("### Berekening Details")
-            st.write(f"Basisvermogen: {result['base_power']}%")
-            st.write(f"Substraat aanpassing: {result['substrate_contribution']:.1f}%")
-            st.write(f"Inkt aanpassing: {result['ink_contribution']:.1f}%")
-            st.write(f"Rasterwals: {rasterwals_type}")
-            st.write(f"Volume: {selected_volume}")
-            st.write(f"Transfer factor: {result['transfer_factor']:.1f}%")
-            st.markdown('</div>', unsafe_allow_html=True)
+            with st.container(key="info-box"):
+                st.subheader("Berekende UV Instellingen")
+
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("UV Vermogen", f"{result['final_power']}%")
+                with col2:
+                    st.metric("Inktoverdracht", result['transfer_value'])
+
+                # Detailed breakdown
+                st.markdown("### Berekening Details")
+                st.write(f"Basisvermogen: {result['base_power']}%")
+                st.write(f"Substraat aanpassing: {result['substrate_contribution']:.1f}%")
+                st.write(f"Inkt aanpassing: {result['ink_contribution']:.1f}%")
+                st.write(f"Rasterwals: {rasterwals_type}")
+                st.write(f"Volume: {selected_volume}")
+                st.write(f"Transfer factor: {result['transfer_factor']:.1f}%")
 
             # Save settings option
             if st.button("Instellingen Opslaan"):
@@ -125,8 +122,12 @@ def main():
     # Display saved settings
     if st.session_state.saved_settings:
         st.markdown("### Opgeslagen Instellingen")
-        df = pd.DataFrame(st.session_state.saved_settings)
-        st.dataframe(df)
+        # Rebuild the table only when settings were added since the last rerun
+        if st.session_state.get('_saved_df_len') != len(st.session_state.saved_settings):
+            import pandas as pd
+            st.session_state._saved_df = pd.DataFrame(st.session_state.saved_settings)
+            st.session_state._saved_df_len = len(st.session_state.saved_settings)
+        st.dataframe(st.session_state._saved_df)
 
 if __name__ == "__main__":
     main()
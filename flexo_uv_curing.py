@@ -1,16 +1,56 @@
-import pandas as pd
-from typing import Optional, Dict, Any
+import sys
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, Dict, Any
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 class FlexoUVCuring:
+    # Volume, BCM and line count shared by all rasterwals types
+    _BASE_SPECS = (
+        ('7 cm³/m²', 4.5, '160 L/cm'),
+        ('10 cm³/m²', 6.4, '120 L/cm'),
+        ('13 cm³/m²', 8.4, '100 L/cm'),
+        ('16 cm³/m²', 10.3, '80 L/cm'),
+        ('20 cm³/m²', 12.9, '60 L/cm')
+    )
+
+    # GTT UniCoat uses size labels instead of volumes, one per base spec
+    _GTT_TYPE = 'GTT UniCoat (25-30% transfer)'
+    _GTT_SIZES = ('S', 'M', 'L', 'XL', 'XXL')
+
+    # Ink transfer per rasterwals type, one per base spec
+    _TRANSFERS = {
+        'Hexagonal (20-30% transfer)': ('1.8 g/m²', '2.5 g/m²', '3.25 g/m²', '4.0 g/m²', '5.0 g/m²'),
+        'Hachure / Trihelical (35-40% transfer)': ('2.3 g/m²', '3.3 g/m²', '4.3 g/m²', '5.3 g/m²', '6.5 g/m²'),
+        'ART / TIF (40-50% transfer)': ('2.7 g/m²', '3.7 g/m²', '5.0 g/m²', '6.0 g/m²', '7.5 g/m²'),
+        'GTT UniCoat (25-30% transfer)': ('1.8 g/m²', '2.5 g/m²', '3.25 g/m²', '4.0 g/m²', '5.0 g/m²')
+    }
+
+    # UV power factors per substrate and ink type
+    _SUBSTRATE_FACTORS = {
+        'Gecoat papier': 1.0,
+        'Ongecoat papier': 1.2,
+        'Folie': 1.3,
+        'Karton': 1.1
+    }
+    _INK_FACTORS = {
+        'UV-inkt': 1.0,
+        'Watergedragen inkt': 1.2,
+        'LED-UV inkt': 0.9
+    }
+
+    # Widget options, interned so lookups on the selected values hit the identity fast path
+    SUBSTRATES = tuple(sys.intern(s) for s in _SUBSTRATE_FACTORS)
+    INK_TYPES = tuple(sys.intern(s) for s in _INK_FACTORS)
+    RASTERWALS_TYPES = tuple(sys.intern(s) for s in _TRANSFERS)
+
     def __init__(self, anilox_data_path: str = "SMARTcure-Anilox-information_NL.docx"):
         """
         Initialize the FlexoUVCuring class with improved error handling.
         """
-        self.anilox_data = None
-        try:
-            self.anilox_data = self.load_anilox_data(anilox_data_path)
-        except Exception as e:
-            print(f"Warning: Could not load anilox data: {str(e)}")
+        # Anilox data is loaded on first use, so pandas is only imported when needed
+        self.anilox_data_path = anilox_data_path
 
         # Define transfer ranges for different rasterwals types
         self.transfer_ranges = {
@@ -20,71 +60,75 @@ class FlexoUVCuring:
             'GTT UniCoat (25-30% transfer)': (0.25, 0.30)
         }
 
-        # Define volume specifications per rasterwals type
-        self.volume_specs = {
-            'Hexagonal (20-30% transfer)': [
-                {'volume': '7 cm³/m²', 'bcm': 4.5, 'lines': '160 L/cm', 'transfer': '1.8 g/m²'},
-                {'volume': '10 cm³/m²', 'bcm': 6.4, 'lines': '120 L/cm', 'transfer': '2.5 g/m²'},
-                {'volume': '13 cm³/m²', 'bcm': 8.4, 'lines': '100 L/cm', 'transfer': '3.25 g/m²'},
-                {'volume': '16 cm³/m²', 'bcm': 10.3, 'lines': '80 L/cm', 'transfer': '4.0 g/m²'},
-                {'volume': '20 cm³/m²', 'bcm': 12.9, 'lines': '60 L/cm', 'transfer': '5.0 g/m²'}
-            ],
-            'Hachure / Trihelical (35-40% transfer)': [
-                {'volume': '7 cm³/m²', 'bcm': 4.5, 'lines': '160 L/cm', 'transfer': '2.3 g/m²'},
-                {'volume': '10 cm³/m²', 'bcm': 6.4, 'lines': '120 L/cm', 'transfer': '3.3 g/m²'},
-                {'volume': '13 cm³/m²', 'bcm': 8.4, 'lines': '100 L/cm', 'transfer': '4.3 g/m²'},
-                {'volume': '16 cm³/m²', 'bcm': 10.3, 'lines': '80 L/cm', 'transfer': '5.3 g/m²'},
-                {'volume': '20 cm³/m²', 'bcm': 12.9, 'lines': '60 L/cm', 'transfer': '6.5 g/m²'}
-            ],
-            'ART / TIF (40-50% transfer)': [
-                {'volume': '7 cm³/m²', 'bcm': 4.5, 'lines': '160 L/cm', 'transfer': '2.7 g/m²'},
-                {'volume': '10 cm³/m²', 'bcm': 6.4, 'lines': '120 L/cm', 'transfer': '3.7 g/m²'},
-                {'volume': '13 cm³/m²', 'bcm': 8.4, 'lines': '100 L/cm', 'transfer': '5.0 g/m²'},
-                {'volume': '16 cm³/m²', 'bcm': 10.3, 'lines': '80 L/cm', 'transfer': '6.0 g/m²'},
-                {'volume': '20 cm³/m²', 'bcm': 12.9, 'lines': '60 L/cm', 'transfer': '7.5 g/m²'}
-            ],
-            'GTT UniCoat (25-30% transfer)': [
-                {'volume': 'S', 'bcm': 4.5, 'lines': 'GTT', 'transfer': '1.8 g/m²', 'actual_volume': '7 cm³/m²'},
-                {'volume': 'M', 'bcm': 6.4, 'lines': 'GTT', 'transfer': '2.5 g/m²', 'actual_volume': '10 cm³/m²'},
-                {'volume': 'L', 'bcm': 8.4, 'lines': 'GTT', 'transfer': '3.25 g/m²', 'actual_volume': '13 cm³/m²'},
-                {'volume': 'XL', 'bcm': 10.3, 'lines': 'GTT', 'transfer': '4.0 g/m²', 'actual_volume': '16 cm³/m²'},
-                {'volume': 'XXL', 'bcm': 12.9, 'lines': 'GTT', 'transfer': '5.0 g/m²', 'actual_volume': '20 cm³/m²'}
-            ]
-        }
+        # Average transfer per rasterwals type
+        self._transfer_avg = {sys.intern(k): sum(v) / 2 for k, v in self.transfer_ranges.items()}
+
+    @cached_property
+    def anilox_data(self) -> Optional["pd.DataFrame"]:
+        """Anilox data, loaded on first access."""
+        try:
+            return self.load_anilox_data(self.anilox_data_path)
+        except Exception as e:
+            print(f"Warning: Could not load anilox data: {str(e)}")
+            return None
+
+    @cached_property
+    def _anilox_arrays(self) -> tuple:
+        """Plain BCM and power arrays for nearest-BCM lookups, avoiding pandas indexing overhead."""
+        if self.anilox_data is None:
+            return None, None
+        return self.anilox_data['bcm'].to_numpy(), self.anilox_data['recommended_power'].to_numpy()
+
+    @cached_property
+    def volume_specs(self) -> Dict[str, list]:
+        """Volume specifications per rasterwals type, built from the base table on first access."""
+        volume_specs = {}
+        for rasterwals_type, transfers in self._TRANSFERS.items():
+            specs = []
+            for (volume, bcm, lines), size, transfer in zip(self._BASE_SPECS, self._GTT_SIZES, transfers):
+                if rasterwals_type == self._GTT_TYPE:
+                    spec = {'volume': size, 'bcm': bcm, 'lines': 'GTT', 'transfer': transfer, 'actual_volume': volume}
+                else:
+                    spec = {'volume': volume, 'bcm': bcm, 'lines': lines, 'transfer': transfer}
+                # Parse numerical transfer value once (e.g., "2.5 g/m²" -> 2.5)
+                spec['transfer_float'] = float(transfer.split()[0])
+                specs.append(spec)
+            volume_specs[rasterwals_type] = specs
+        return volume_specs
+
+    @cached_property
+    def _volume_index(self) -> Dict[str, Dict[str, dict]]:
+        """Specs per rasterwals type keyed by volume, so lookups avoid scanning the lists."""
+        return {k: {s['volume']: s for s in v} for k, v in self.volume_specs.items()}
 
     def get_volume_specs(self, rasterwals_type: str) -> list:
         """Get volume specifications for a specific rasterwals type."""
         return self.volume_specs.get(rasterwals_type, [])
 
+    def get_spec(self, rasterwals_type: str, selected_volume: str) -> Optional[dict]:
+        """Get the volume specification for selected volume and rasterwals type."""
+        return self._volume_index.get(rasterwals_type, {}).get(selected_volume)
+
     def get_bcm_from_volume(self, rasterwals_type: str, selected_volume: str) -> float:
         """Get BCM value for selected volume and rasterwals type."""
-        specs = self.volume_specs.get(rasterwals_type, [])
-        for spec in specs:
-            if spec['volume'] == selected_volume:
-                return spec['bcm']
-        return 0.0
+        spec = self.get_spec(rasterwals_type, selected_volume)
+        return spec['bcm'] if spec else 0.0
 
     def get_transfer_from_volume(self, rasterwals_type: str, selected_volume: str) -> str:
         """Get transfer value for selected volume and rasterwals type."""
-        specs = self.volume_specs.get(rasterwals_type, [])
-        for spec in specs:
-            if spec['volume'] == selected_volume:
-                return spec['transfer']
-        return "0.0 g/m²"
+        spec = self.get_spec(rasterwals_type, selected_volume)
+        return spec['transfer'] if spec else "0.0 g/m²"
 
     def calculate_transfer_factor(self, rasterwals_type: str, selected_volume: str) -> float:
         """Calculate transfer factor based on rasterwals type and volume."""
-        # Get transfer range for rasterwals type
-        transfer_range = self.transfer_ranges.get(rasterwals_type, (0.25, 0.30))
-        transfer_avg = sum(transfer_range) / 2
+        # Get average transfer for rasterwals type
+        transfer_avg = self._transfer_avg.get(rasterwals_type, 0.275)
 
-        # Get volume specs
-        specs = self.volume_specs.get(rasterwals_type, [])
-        selected_spec = next((spec for spec in specs if spec['volume'] == selected_volume), None)
+        # Get volume spec
+        selected_spec = self.get_spec(rasterwals_type, selected_volume)
 
         if selected_spec:
-            # Extract numerical value from transfer string (e.g., "2.5 g/m²" -> 2.5)
-            transfer_value = float(selected_spec['transfer'].split()[0])
+            transfer_value = selected_spec['transfer_float']
             # Adjust transfer factor based on volume
             return transfer_avg * (transfer_value / 3.0)  # normalize against medium transfer value
 
@@ -96,30 +140,16 @@ class FlexoUVCuring:
         Returns both the power and explanation.
         """
         base_power = 40  # Base UV power
-        power_factors = {
-            'substraat': {
-                'Gecoat papier': 1.0,
-                'Ongecoat papier': 1.2,
-                'Folie': 1.3,
-                'Karton': 1.1
-            },
-            'inktsoort': {
-                'UV-inkt': 1.0,
-                'Watergedragen inkt': 1.2,
-                'LED-UV inkt': 0.9
-            }
-        }
 
         # Calculate power with explanations
-        substrate_factor = power_factors['substraat'].get(substraat, 1.0)
-        ink_factor = power_factors['inktsoort'].get(inktsoort, 1.0)
+        substrate_factor = self._SUBSTRATE_FACTORS.get(substraat, 1.0)
+        ink_factor = self._INK_FACTORS.get(inktsoort, 1.0)
         transfer_factor = self.calculate_transfer_factor(rasterwals_type, selected_volume)
         bcm_factor = bcm * 0.1  # BCM contribution to power
 
-        # Calculate final power
-        uv_vermogen = base_power * substrate_factor * ink_factor * (1 + bcm_factor)
-        uv_vermogen = uv_vermogen * (1 + transfer_factor)  # Increase power based on transfer efficiency
-        uv_vermogen = max(20, min(uv_vermogen, 100))  # Limit between 20-100%
+        # Calculate final power, increased based on transfer efficiency
+        uv_vermogen = base_power * substrate_factor * ink_factor * (1 + bcm_factor) * (1 + transfer_factor)
+        uv_vermogen = 20 if uv_vermogen < 20 else 100 if uv_vermogen > 100 else uv_vermogen  # Limit between 20-100%
 
         # Get actual transfer value for display
         transfer_value = self.get_transfer_from_volume(rasterwals_type, selected_volume)
@@ -136,10 +166,12 @@ class FlexoUVCuring:
 
         return explanation
 
-    def load_anilox_data(self, file_path: str) -> Optional[pd.DataFrame]:
+    def load_anilox_data(self, file_path: str) -> Optional["pd.DataFrame"]:
         """
         Load anilox information from document with error handling.
         """
+        import pandas as pd
+
         try:
             # Placeholder for actual data loading
             # In real implementation, this would parse the docx file
@@ -153,15 +185,14 @@ class FlexoUVCuring:
 
     def get_recommended_settings(self, bcm: float) -> Optional[float]:
         """Get recommended power settings from anilox data."""
-        if self.anilox_data is None:
+        from _kernels import nearest_idx
+
+        bcm_arr, power_arr = self._anilox_arrays
+        if bcm_arr is None:
             return None
 
         # Find closest BCM value and return recommended power
-        closest_bcm = self.anilox_data['bcm'].iloc[
-            (self.anilox_data['bcm'] - bcm).abs().argsort()[:1]
-        ].iloc[0]
-
-        return self.anilox_data.loc[
-            self.anilox_data['bcm'] == closest_bcm,
-            'recommended_power'
-        ].iloc[0]
+        idx = nearest_idx(bcm_arr, bcm)
+        if idx < 0:
+            return None
+        return power_arr[idx]
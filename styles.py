@@ -1,7 +1,6 @@
 import streamlit as st
 
-def apply_custom_styles():
-    st.markdown("""
+_CSS = """
         <style>
         .stButton > button {
             width: 100%;
@@ -12,19 +11,25 @@ def apply_custom_styles():
         .stTextInput > div > div > input {
             background-color: #f8f9fa;
         }
-        .industrial-header {
+        .st-key-industrial-header {
             background-color: #2c3e50;
             padding: 1rem;
             border-radius: 5px;
             color: white;
             margin-bottom: 2rem;
         }
-        .info-box {
+        .st-key-industrial-header h1 {
+            color: white;
+        }
+        .st-key-info-box {
             background-color: #e9ecef;
             padding: 1rem;
             border-radius: 5px;
             margin: 1rem 0;
         }
         </style>
-    """, unsafe_allow_html=True)
+    """
+
+def apply_custom_styles():
+    st.markdown(_CSS, unsafe_allow_html=True)
 
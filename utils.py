@@ -1,17 +1,37 @@
 import json
 from typing import Dict, List, Any
 import os
+import streamlit as st
+
+SETTINGS_FILE = 'saved_settings.json'
+
+_HELP_TEXTS = {
+    'substrate': "Het type materiaal waarop gedrukt wordt. Dit beïnvloedt de UV-absorptie.",
+    'ink_type': "Het type inkt dat gebruikt wordt. UV-inkt heeft andere uithardingseisen.",
+    'bcm': "BCM (Billion Cubic Microns) is het celvolume van de aniloxwals.",
+    'rasterwals': "Het type rasterwals bepaalt de inktoverdracht. Een hogere transfer betekent meer inkt en dus meer UV-vermogen nodig.",
+    'volume': "Het specifieke volume van de rasterwals dat de hoeveelheid inkt bepaalt die kan worden overgedragen.",
+    'general': "CleverCuring helpt bij het bepalen van de optimale UV-uitharding instellingen voor flexografisch drukwerk."
+}
 
 def validate_bcm(bcm: float) -> bool:
     """Validate BCM value."""
     return 0 < bcm <= 20  # Typical BCM range for flexographic printing
 
+@st.cache_data(ttl=None)
+def _read_settings_file(path: str, mtime: float) -> List[Dict[str, Any]]:
+    """Read settings from file; mtime is only part of the cache key."""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except Exception:
+        return []
+
 def load_saved_settings() -> List[Dict[str, Any]]:
     """Load saved settings from file."""
     try:
-        if os.path.exists('saved_settings.json'):
-            with open('saved_settings.json', 'r') as f:
-                return json.load(f)
+        if os.path.exists(SETTINGS_FILE):
+            return _read_settings_file(SETTINGS_FILE, os.path.getmtime(SETTINGS_FILE))
     except Exception:
         pass
     return []
@@ -19,19 +39,11 @@ def load_saved_settings() -> List[Dict[str, Any]]:
 def save_settings(settings: List[Dict[str, Any]]) -> None:
     """Save settings to file."""
     try:
-        with open('saved_settings.json', 'w') as f:
+        with open(SETTINGS_FILE, 'w') as f:
             json.dump(settings, f)
     except Exception as e:
         print(f"Error saving settings: {str(e)}")
 
 def get_help_text(field: str) -> str:
     """Return help text for different fields."""
-    help_texts = {
-        'substrate': "Het type materiaal waarop gedrukt wordt. Dit beïnvloedt de UV-absorptie.",
-        'ink_type': "Het type inkt dat gebruikt wordt. UV-inkt heeft andere uithardingseisen.",
-        'bcm': "BCM (Billion Cubic Microns) is het celvolume van de aniloxwals.",
-        'rasterwals': "Het type rasterwals bepaalt de inktoverdracht. Een hogere transfer betekent meer inkt en dus meer UV-vermogen nodig.",
-        'volume': "Het specifieke volume van de rasterwals dat de hoeveelheid inkt bepaalt die kan worden overgedragen.",
-        'general': "CleverCuring helpt bij het bepalen van de optimale UV-uitharding instellingen voor flexografisch drukwerk."
-    }
-    return help_texts.get(field, "")
+    return _HELP_TEXTS.get(field, "")